@@ -1,12 +1,30 @@
-import plot_likert.plot_likert as __internal__
-from .plot_likert import (
-    plot_likert,
-    plot_counts,
-    likert_counts,
-    likert_percentages,
-    likert_response,
-    raw_scale,
-    PlotLikertError,
-)
+from .common import PlotLikertError, normalize_counts
+from .svg import plot_counts_svg
+
+try:
+    import matplotlib
+except ImportError:
+    # Without matplotlib, only the SVG renderer and the helpers above are available
+    pass
+else:
+    import plot_likert.plot_likert as __internal__
+    from .plot_likert import (
+        plot_likert,
+        plot_counts,
+        likert_counts,
+        likert_percentages,
+        likert_response,
+        raw_scale,
+        validate_responses,
+    )
+    from .preview import likert_counts_preview, plot_likert_preview
+    from .index import IndexedResponses
+    from .template import (
+        PlotTemplate,
+        get_template,
+        evict_template,
+        clear_templates,
+        plot_counts_with_template,
+    )
 
 name = "plot_likert"
@@ -0,0 +1,112 @@
+"""
+Settings and helpers shared by the matplotlib and SVG renderers
+
+Nothing in here depends on matplotlib, so that the SVG renderer can be used without it.
+"""
+
+from warnings import warn
+
+import numpy as np
+import pandas as pd
+
+HIDE_EXCESSIVE_TICK_LABELS = True
+PADDING_LEFT = 0.02  # fraction of the total width to use as padding
+PADDING_RIGHT = 0.04  # fraction of the total width to use as padding
+BAR_LABEL_FORMAT = (
+    "%g"  # if showing labels, how should the number be formatted? e.g., "%.2g"
+)
+BAR_LABEL_SIZE_CUTOFF = 0.05
+UNEQUAL_RESPONSES_WARNING = "In your data, not all questions have the same number of responses. i.e., different numbers of people answered each question. Therefore, the percentages aren't directly comparable: X% for one question represents a different number of responses than X% for another question, yet they will appear the same in the percentage graph. This may be misleading to your reader."
+
+
+class PlotLikertError(ValueError):
+    pass
+
+
+NORMALIZATION_DIRECTIONS = ("row", "column")
+
+
+def normalize_counts(
+    counts: pd.DataFrame,
+    direction: str = "row",
+    dtype=np.float64,
+    round_integers: bool = False,
+) -> pd.DataFrame:
+    """
+    Given a dataframe of response counts, return a new one
+    with the response counts converted to percentages, in a single vectorized pass.
+
+    Parameters
+    ----------
+    counts : pd.DataFrame
+        The counts of responses, with a row for each question and a column for each response,
+        e.g., as returned by likert_counts.
+    direction : str, default = "row"
+        "row" computes the percentage of each question's responses that chose each option
+        (and warns if the questions have different numbers of responses),
+        "column" computes the percentage of each option's responses that went to each question.
+    dtype : numpy.float32 or numpy.float64, default = numpy.float64
+        The data type of the returned percentages.
+    round_integers : bool, default = False
+        Round the percentages to integers using the largest-remainder method,
+        so that each row (or column) still adds up to exactly 100.
+
+    Returns
+    -------
+    pd.DataFrame
+        The percentages, with the same index and columns as the counts.
+        Questions (or options) without any responses get NaN.
+    """
+    if direction not in NORMALIZATION_DIRECTIONS:
+        raise PlotLikertError(
+            f"unknown normalization direction `{direction}`, expected one of {NORMALIZATION_DIRECTIONS}"
+        )
+    if np.dtype(dtype) not in (np.dtype(np.float32), np.dtype(np.float64)):
+        raise PlotLikertError(
+            f"percentages can only be computed as float32 or float64, not {np.dtype(dtype)}"
+        )
+
+    axis = 1 if direction == "row" else 0
+    values = counts.to_numpy(dtype=np.float64)
+    # Like DataFrame.sum, skip missing counts instead of making the whole total NaN
+    totals = np.nansum(values, axis=axis, keepdims=True)
+
+    # Warn if the rows have different counts
+    # If they do, the percentages shouldn't be compared.
+    if direction == "row" and totals.size > 0 and not (totals == totals[0]).all():
+        warn(UNEQUAL_RESPONSES_WARNING)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percentages = values * 100 / totals
+
+    if round_integers:
+        percentages = _round_largest_remainder(percentages, axis)
+
+    return pd.DataFrame(
+        percentages.astype(dtype, copy=False),
+        index=counts.index,
+        columns=counts.columns,
+    )
+
+
+def _round_largest_remainder(percentages: np.ndarray, axis: int) -> np.ndarray:
+    """
+    Round the given percentages down to integers, then give the points lost to rounding
+    back to the values with the largest remainders, so that each row (or column) adds up to 100.
+    """
+    floors = np.floor(percentages)
+    remainders = percentages - floors
+    shortfall = 100 - np.nansum(floors, axis=axis, keepdims=True)
+
+    # Rank the remainders from largest to smallest, and round up the top ones
+    order = np.argsort(-remainders, axis=axis, kind="stable")
+    ranks = np.argsort(order, axis=axis, kind="stable")
+    return floors + (ranks < shortfall)
+
+
+def _compute_counts_percentage(counts: pd.DataFrame) -> pd.DataFrame:
+    """
+    Given a dataframe of response counts, return a new one
+    with the response counts converted to percentages.
+    """
+    return normalize_counts(counts)
@@ -0,0 +1,176 @@
+"""
+Indexed storage of Likert responses, for quickly counting many slices of the same data
+
+The responses are validated and encoded as integer codes once,
+and every filter column gets a boolean index per distinct value.
+Counting the responses of a slice is then a matter of intersecting those indexes
+and running a single bincount, instead of filtering the DataFrame and calling likert_counts again.
+"""
+
+import collections
+import typing
+
+import numpy as np
+import pandas as pd
+
+from plot_likert.scales import Scale
+from plot_likert.plot_likert import PlotLikertError, validate_responses, _wrap_label
+
+Filters = typing.Dict[typing.Any, typing.Any]
+
+# How many per-value indexes to keep before evicting the least recently used
+MAX_CACHED_INDEXES = 64
+
+
+class IndexedResponses:
+    """
+    Likert responses encoded for repeated counting under different filters.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        A dataframe with questions in column names and answers recorded as cell values,
+        along with any columns that will be used for filtering.
+    scale : list of str
+        The scale of possible responses.
+    filter_columns : list, optional
+        The columns that can be used to filter respondents.
+    questions : list, optional
+        The columns containing Likert responses. Defaults to every column not in filter_columns.
+    label_max_width : int
+        The character wrap length of the question labels.
+    drop_zeros : bool
+        Indicates whether the data have NA values that should be dropped (True) or not (False).
+
+    Examples
+    --------
+    >>> responses = IndexedResponses(df, scales.agree, filter_columns=["age", "region"])
+    >>> counts = responses.counts(age=["25-29", "30-34"], region="EU")
+    >>> plot_counts(counts, scales.agree)
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        scale: Scale,
+        filter_columns: typing.Optional[typing.List] = None,
+        questions: typing.Optional[typing.List] = None,
+        label_max_width=30,
+        drop_zeros=False,
+    ):
+        filter_columns = list(filter_columns or [])
+        if questions is None:
+            questions = [
+                column for column in df.columns if column not in filter_columns
+            ]
+
+        self.scale = list(scale)
+        self.drop_zeros = drop_zeros
+        self.num_rows = len(df)
+        self.labels = [_wrap_label(str(label), label_max_width) for label in questions]
+
+        # Encode each answer as its position in the scale, with -1 for missing values
+        responses, _ = validate_responses(df[questions], scale, mode="strict")
+        code_dtype = np.int8 if len(self.scale) < 127 else np.int32
+        self._codes = np.empty((len(questions), self.num_rows), dtype=code_dtype)
+        for i in range(len(questions)):
+            column = responses.iloc[:, i]
+            self._codes[i] = pd.Categorical(column, categories=self.scale).codes
+
+        # Factorize the filter columns now; the per-value indexes are built when first needed
+        self._filter_codes = {}
+        self._filter_values = {}
+        for column in filter_columns:
+            codes, uniques = pd.factorize(df[column])
+            self._filter_codes[column] = codes
+            self._filter_values[column] = {value: i for i, value in enumerate(uniques)}
+        self._indexes: "collections.OrderedDict[typing.Tuple, np.ndarray]" = (
+            collections.OrderedDict()
+        )
+        # Shared by every value that doesn't occur in its column
+        self._empty_index = np.zeros(self.num_rows, dtype=bool)
+        self._empty_index.flags.writeable = False
+
+    def index(self, column, value) -> np.ndarray:
+        """
+        Return the boolean index of rows where the given filter column has the given value.
+        Up to MAX_CACHED_INDEXES of these are cached, evicting the least recently used.
+        The returned array is read-only, since it may be shared.
+        """
+        if column not in self._filter_codes:
+            raise PlotLikertError(
+                f"`{column}` is not one of the indexed filter columns"
+            )
+
+        code = self._filter_values[column].get(value)
+        if code is None:
+            return self._empty_index
+
+        key = (column, value)
+        if key in self._indexes:
+            self._indexes.move_to_end(key)
+            return self._indexes[key]
+
+        index = self._filter_codes[column] == code
+        index.flags.writeable = False
+        self._indexes[key] = index
+        while len(self._indexes) > MAX_CACHED_INDEXES:
+            self._indexes.popitem(last=False)
+        return index
+
+    def clear_index_cache(self):
+        """
+        Drop every cached per-value index; they'll be rebuilt as needed.
+        """
+        self._indexes.clear()
+
+    def mask(self, filters: typing.Optional[Filters] = None, **kwargs) -> np.ndarray:
+        """
+        Return the boolean mask of rows matching all of the given filters.
+
+        Each filter maps a column to either a single value or a list of accepted values.
+        Filters can be passed as a dict (for column names that aren't valid identifiers),
+        as keyword arguments, or both.
+        """
+        filters = {**(filters or {}), **kwargs}
+
+        mask = np.ones(self.num_rows, dtype=bool)
+        for column, accepted in filters.items():
+            if isinstance(accepted, (list, tuple, set, frozenset)):
+                column_mask = np.zeros(self.num_rows, dtype=bool)
+                for value in accepted:
+                    column_mask |= self.index(column, value)
+            else:
+                column_mask = self.index(column, accepted)
+            mask &= column_mask
+        return mask
+
+    def counts(
+        self, filters: typing.Optional[Filters] = None, **kwargs
+    ) -> pd.DataFrame:
+        """
+        Return the counts of each response among the rows matching the given filters,
+        in the same format as likert_counts, ready to be passed to plot_counts.
+
+        See mask for how to specify filters.
+        """
+        mask = self.mask(filters, **kwargs)
+        selected = self._codes[:, mask]
+
+        # Count every question at once: offset each question's codes into its own range of bins
+        num_bins = len(self.scale) + 1  # one extra bin for missing values
+        offsets = np.arange(len(self.labels))[:, np.newaxis] * num_bins
+        binned = np.bincount(
+            (selected.astype(np.intp) + 1 + offsets).ravel(),
+            minlength=len(self.labels) * num_bins,
+        ).reshape(len(self.labels), num_bins)
+
+        counts = pd.DataFrame(
+            binned[:, 1:].astype(float), index=self.labels, columns=self.scale
+        )
+
+        # remove NA scores
+        if self.drop_zeros == True:
+            counts = counts.drop("0", axis=1)
+
+        return counts
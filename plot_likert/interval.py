@@ -2,6 +2,7 @@
 Module for computing the best interval for the x-ticks on a plot
 """
 
+import functools
 import typing
 
 
@@ -52,10 +53,12 @@ def get_best_interval_in_list(candidate_intervals: typing.List[int]) -> int:
     return best_interval
 
 
+@functools.lru_cache(maxsize=1024)
 def get_interval_for_scale(tick_space: int, max_width: int) -> int:
     """
     Given a width of the plot (max_width) and a suggested number of tick marks (tick_space),
     return the "best" interval to use between tick marks.
+    The result is memoized, since it only depends on these two numbers.
     """
     min_ticks = tick_space - 5
     min_ticks = 1 if min_ticks <= 0 else min_ticks
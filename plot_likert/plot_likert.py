@@ -11,6 +11,7 @@ for a float: scores.applymap(int).applymap(str)
 """
 
 
+import functools
 import logging
 import typing
 from warnings import warn
@@ -23,6 +24,7 @@ import pandas as pd
 try:
     import matplotlib.axes
     import matplotlib.pyplot as plt
+    import matplotlib.text
 except RuntimeError as err:
     logging.error(
         "Couldn't import matplotlib, likely because this package is running in an environment that doesn't support it (i.e., without a graphical output). See error for more information."
@@ -33,17 +35,17 @@ from plot_likert.scales import Scale
 import plot_likert.colors as builtin_colors
 import plot_likert.interval as interval_helper
 
-HIDE_EXCESSIVE_TICK_LABELS = True
-PADDING_LEFT = 0.02  # fraction of the total width to use as padding
-PADDING_RIGHT = 0.04  # fraction of the total width to use as padding
-BAR_LABEL_FORMAT = (
-    "%g"  # if showing labels, how should the number be formatted? e.g., "%.2g"
+from plot_likert.common import (
+    HIDE_EXCESSIVE_TICK_LABELS,
+    PADDING_LEFT,
+    PADDING_RIGHT,
+    BAR_LABEL_FORMAT,
+    BAR_LABEL_SIZE_CUTOFF,
+    UNEQUAL_RESPONSES_WARNING,
+    PlotLikertError,
+    normalize_counts,
+    _compute_counts_percentage,
 )
-BAR_LABEL_SIZE_CUTOFF = 0.05
-
-
-class PlotLikertError(ValueError):
-    pass
 
 
 def plot_counts(
@@ -111,6 +113,40 @@ def plot_counts(
         else:
             counts_are_percentages = False
 
+    return _plot_counts(
+        counts,
+        scale,
+        counts_are_percentages,
+        colors=colors,
+        figsize=figsize,
+        xtick_interval=xtick_interval,
+        bar_labels=bar_labels,
+        bar_labels_color=bar_labels_color,
+        percentage_bar_labels=compute_percentages,
+        **kwargs,
+    )
+
+
+def _plot_counts(
+    counts: pd.DataFrame,
+    scale: Scale,
+    counts_are_percentages: bool,
+    colors: builtin_colors.Colors = builtin_colors.default,
+    figsize=None,
+    xtick_interval: typing.Optional[int] = None,
+    bar_labels: bool = False,
+    bar_labels_color: typing.Union[str, typing.List[str]] = "white",
+    percentage_bar_labels: typing.Optional[bool] = None,
+    **kwargs,
+) -> matplotlib.axes.Axes:
+    """
+    Plot the given counts as they are, without converting them to percentages.
+    If counts_are_percentages is set, the axis is labeled with percentages.
+    The bar labels get % signs if percentage_bar_labels is set (by default, the same as counts_are_percentages).
+    """
+    if percentage_bar_labels is None:
+        percentage_bar_labels = counts_are_percentages
+
     # Pad each row/question from the left, so that they're centered around the middle (Neutral) response
     scale_middle = len(scale) // 2
 
@@ -150,6 +186,53 @@ def plot_counts(
     else:
         interval = xtick_interval
 
+    xvalues, xlabels = _compute_xticks(
+        center,
+        max_width,
+        interval,
+        counts.sum(axis="columns").max(),
+        counts_are_percentages,
+    )
+
+    axes.set_xticks(xvalues)
+    axes.set_xticklabels(xlabels)
+    if counts_are_percentages is True:
+        axes.set_xlabel("Percentage of Responses")
+    else:
+        axes.set_xlabel("Number of Responses")
+
+    # Reposition the legend if present
+    if axes.get_legend():
+        axes.legend(bbox_to_anchor=(1.05, 1))
+
+    # Adjust padding
+    counts_sum = counts.sum(axis="columns").max()
+    # Pad the bars on the left (so there's a gap between the axis and the first section)
+    padding_left = counts_sum * PADDING_LEFT
+    # Tighten the padding on the right of the figure
+    padding_right = counts_sum * PADDING_RIGHT
+    x_min, x_max = axes.get_xlim()
+    axes.set_xlim(x_min - padding_left, x_max - padding_right)
+
+    # Add labels
+    if bar_labels:
+        _add_bar_labels(
+            axes, scale, counts_sum, percentage_bar_labels, bar_labels_color
+        )
+
+    return axes
+
+
+def _compute_xticks(
+    center: float,
+    max_width: int,
+    interval: int,
+    total_max: float,
+    counts_are_percentages: bool,
+) -> typing.Tuple[np.ndarray, typing.List[typing.Union[int, str]]]:
+    """
+    Return the positions and labels of the x-axis ticks, for a plot centered on the given value.
+    """
     right_edge = max_width - center
     right_labels = np.arange(interval, right_edge + interval, interval)
     right_values = center + right_labels
@@ -165,73 +248,194 @@ def plot_counts(
     if HIDE_EXCESSIVE_TICK_LABELS:
         # Labels for tick values that are too high are hidden,
         # but the tick mark itself remains displayed.
-        total_max = counts.sum(axis="columns").max()
         xlabels = ["" if label > total_max else label for label in xlabels]
 
     if counts_are_percentages:
         xlabels = [str(label) + "%" if label != "" else "" for label in xlabels]
 
-    axes.set_xticks(xvalues)
-    axes.set_xticklabels(xlabels)
-    if counts_are_percentages is True:
-        axes.set_xlabel("Percentage of Responses")
+    return xvalues, xlabels
+
+
+def _add_bar_labels(
+    axes: matplotlib.axes.Axes,
+    scale: Scale,
+    counts_sum: float,
+    compute_percentages: bool,
+    bar_labels_color: typing.Union[str, typing.List[str]],
+) -> typing.List[matplotlib.text.Text]:
+    """
+    Label each bar segment with its value, hiding the labels of segments too small to fit them.
+    Returns the created labels.
+    """
+    bar_label_format = BAR_LABEL_FORMAT + ("%%" if compute_percentages else "")
+    bar_size_cutoff = counts_sum * BAR_LABEL_SIZE_CUTOFF
+
+    if isinstance(bar_labels_color, list):
+        if len(bar_labels_color) != len(scale):
+            raise PlotLikertError(
+                "list of bar label colors must have as many values as the scale"
+            )
+        bar_label_colors = bar_labels_color
     else:
-        axes.set_xlabel("Number of Responses")
+        bar_label_colors = [bar_labels_color] * len(scale)
 
-    # Reposition the legend if present
-    if axes.get_legend():
-        axes.legend(bbox_to_anchor=(1.05, 1))
+    all_labels = []
+    for i, segment in enumerate(
+        axes.containers[1:]  # the first container is the padding
+    ):
+        try:
+            labels = axes.bar_label(
+                segment,
+                label_type="center",
+                fmt=bar_label_format,
+                padding=0,
+                color=bar_label_colors[i],
+                weight="bold",
+            )
+        except AttributeError:
+            raise PlotLikertError(
+                "Rendering bar labels requires matplotlib version 3.4.0 or higher"
+            )
 
-    # Adjust padding
-    counts_sum = counts.sum(axis="columns").max()
-    # Pad the bars on the left (so there's a gap between the axis and the first section)
-    padding_left = counts_sum * PADDING_LEFT
-    # Tighten the padding on the right of the figure
-    padding_right = counts_sum * PADDING_RIGHT
-    x_min, x_max = axes.get_xlim()
-    axes.set_xlim(x_min - padding_left, x_max - padding_right)
+        # Remove labels that don't fit because the bars are too small
+        for label in labels:
+            label_text = label.get_text()
+            if compute_percentages:
+                label_text = label_text.rstrip("%")
+            number = float(label_text)
+            if number < bar_size_cutoff:
+                label.set_text("")
+        all_labels.extend(labels)
+
+    return all_labels
 
-    # Add labels
-    if bar_labels:
-        bar_label_format = BAR_LABEL_FORMAT + ("%%" if compute_percentages else "")
-        bar_size_cutoff = counts_sum * BAR_LABEL_SIZE_CUTOFF
-
-        if isinstance(bar_labels_color, list):
-            if len(bar_labels_color) != len(scale):
-                raise PlotLikertError(
-                    "list of bar label colors must have as many values as the scale"
-                )
-            bar_label_colors = bar_labels_color
-        else:
-            bar_label_colors = [bar_labels_color] * len(scale)
 
-        for i, segment in enumerate(
-            axes.containers[1:]  # the first container is the padding
-        ):
+@functools.lru_cache(maxsize=4096)
+def _wrap_label(label: str, width: int) -> str:
+    """
+    Wrap a question label into lines of at most the given width.
+    This is memoized, since the same questions tend to be plotted over and over.
+    """
+    return "\n".join(wrap(label, width))
+
+
+VALIDATION_MODES = ("strict", "coerce", "normalize")
+
+
+def _normalized_response(value) -> str:
+    """
+    Return a canonical form of the given response, ignoring whitespace, capitalization,
+    and the difference between ints, integral floats, and their string representations.
+    """
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        value = int(value)
+    return " ".join(str(value).split()).casefold()
+
+
+def validate_responses(
+    df: typing.Union[pd.DataFrame, pd.Series],
+    scale: Scale,
+    mode: str = "strict",
+) -> typing.Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Check every response against the provided scale in a single vectorized pass,
+    and report all of the values that aren't on it.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or pandas.Series
+        A dataframe with questions in column names and answers recorded as cell values.
+    scale : list of str
+        The scale of valid responses.
+    mode : str, default = "strict"
+        What to do with responses that aren't on the scale:
+        "strict" raises a PlotLikertError describing all of them,
+        "coerce" replaces them with NaN,
+        "normalize" replaces them with the scale value they match after ignoring
+        whitespace, capitalization, and type (int versus str), or NaN if there's none.
+
+    Returns
+    -------
+    (pandas.DataFrame, pandas.DataFrame)
+        The validated responses, and a report with one row per distinct invalid value in each column,
+        with the columns `column`, `value`, `count`, and `replacement`.
+    """
+    if mode not in VALIDATION_MODES:
+        raise PlotLikertError(
+            f"unknown validation mode `{mode}`, expected one of {VALIDATION_MODES}"
+        )
+
+    if type(df) == pd.core.series.Series:
+        df = df.to_frame()
+
+    if mode == "normalize":
+        normalized_scale = {}
+        for option in scale:
+            normalized_scale.setdefault(_normalized_response(option), option)
+
+    report_rows = []
+    replaced_columns = {}
+    for position, column in enumerate(df.columns):
+        responses = df.iloc[:, position]
+        invalid = ~(responses.isin(scale) | responses.isna())
+        if not invalid.any():
+            continue
+
+        # Work out each distinct invalid value's replacement only once.
+        # Values are grouped by type first, since value_counts would merge values
+        # that compare equal across types (like True and 1, or 1 and 1.0).
+        # Categorical columns are compared as plain objects, so that valid categories
+        # don't show up in the counts of invalid values.
+        invalid_positions = invalid.to_numpy()
+        invalid_responses = responses[invalid_positions].astype(object)
+        value_types = invalid_responses.map(type).to_numpy()
+        replaced_values = np.empty(len(invalid_responses), dtype=object)
+        for value_type in dict.fromkeys(value_types):
+            same_type = value_types == value_type
+            invalid_counts = invalid_responses[same_type].value_counts(sort=False)
+            replacements = {}
+            for value, count in invalid_counts.items():
+                replacement = np.nan
+                if mode == "normalize":
+                    replacement = normalized_scale.get(
+                        _normalized_response(value), np.nan
+                    )
+                replacements[value] = replacement
+                report_rows.append((column, value, count, replacement))
+            replaced_values[same_type] = (
+                invalid_responses[same_type].map(replacements).to_numpy()
+            )
+
+        if mode != "strict":
+            cleaned = responses.astype(object).to_numpy(copy=True)
+            cleaned[invalid_positions] = replaced_values
+            replaced_columns[position] = pd.Series(
+                cleaned, index=responses.index, name=responses.name
+            )
+
+    report = pd.DataFrame(
+        report_rows, columns=["column", "value", "count", "replacement"]
+    )
+
+    if mode == "strict" and len(report) > 0:
+        first_value = report["value"].iloc[0]
+        summary = "; ".join(
+            f"`{value}` ({count}x in `{column}`)"
+            for column, value, count, _ in report_rows
+        )
+        raise PlotLikertError(
+            f"A response was found with value `{first_value}`, which is not one of the values in the provided scale: {scale}. If this is unexpected, you might want to double-check for extra whitespace, capitalization, spelling, or type (int versus str). All invalid responses: {summary}"
+        )
+
+    if replaced_columns:
+        df = df.copy()
+        for position, responses in replaced_columns.items():
             try:
-                labels = axes.bar_label(
-                    segment,
-                    label_type="center",
-                    fmt=bar_label_format,
-                    padding=0,
-                    color=bar_label_colors[i],
-                    weight="bold",
-                )
-            except AttributeError:
-                raise PlotLikertError(
-                    "Rendering bar labels requires matplotlib version 3.4.0 or higher"
-                )
-
-            # Remove labels that don't fit because the bars are too small
-            for label in labels:
-                label_text = label.get_text()
-                if compute_percentages:
-                    label_text = label_text.rstrip("%")
-                number = float(label_text)
-                if number < bar_size_cutoff:
-                    label.set_text("")
+                df.isetitem(position, responses)
+            except AttributeError:  # for compatibility with Pandas < 1.5.0
+                df.iloc[:, position] = responses
 
-    return axes
+    return df, report
 
 
 def likert_counts(
@@ -248,20 +452,11 @@ def likert_counts(
     if type(df) == pd.core.series.Series:
         df = df.to_frame()
 
-    def validate(value):
-        if (not pd.isna(value)) and (value not in scale):
-            raise PlotLikertError(
-                f"A response was found with value `{value}`, which is not one of the values in the provided scale: {scale}. If this is unexpected, you might want to double-check for extra whitespace, capitalization, spelling, or type (int versus str)."
-            )
-
-    try:
-        df.map(validate)
-    except AttributeError:  # for compatibility with Pandas < 2.1.0
-        df.applymap(validate)
+    df, _ = validate_responses(df, scale, mode="strict")
 
     # fix long questions for printing
     old_labels = list(df)
-    new_labels = ["\n".join(wrap(str(l), label_max_width)) for l in old_labels]
+    new_labels = [_wrap_label(str(l), label_max_width) for l in old_labels]
     if pd.__version__ >= "1.5.0":
         df = df.set_axis(new_labels, axis=1, copy=True)
     else:
@@ -279,49 +474,22 @@ def likert_counts(
 
 
 def likert_percentages(
-    df: pd.DataFrame, scale: Scale, width=30, zero=False
+    df: pd.DataFrame,
+    scale: Scale,
+    width=30,
+    zero=False,
+    dtype=np.float64,
+    round_integers: bool = False,
 ) -> pd.DataFrame:
     """
     Given a dataframe of Likert-style responses, returns a new one
     reporting the percentage of respondents that chose each response.
-    Percentages are rounded to integers.
+    Set round_integers to round the percentages to integers that still add up to 100.
+    See normalize_counts for the available dtypes.
     """
 
     counts = likert_counts(df, scale, width, zero)
-
-    # Warn if the rows have different counts
-    # If they do, the percentages shouldn't be compared.
-    responses_per_question = counts.sum(axis=1)
-    responses_to_first_question = responses_per_question.iloc[0]
-    responses_same = responses_per_question == responses_to_first_question
-    if not responses_same.all():
-        warn(
-            "In your data, not all questions have the same number of responses. i.e., different numbers of people answered each question. Therefore, the percentages aren't directly comparable: X% for one question represents a different number of responses than X% for another question, yet they will appear the same in the percentage graph. This may be misleading to your reader."
-        )
-
-    try:
-        return counts.apply(lambda row: row / row.sum(), axis=1).map(lambda v: 100 * v)
-    except AttributeError:  # for compatibility with Pandas < 2.1.0
-        return counts.apply(lambda row: row / row.sum(), axis=1).applymap(
-            lambda v: 100 * v
-        )
-
-
-def _compute_counts_percentage(counts: pd.DataFrame) -> pd.DataFrame:
-    """
-    Given a dataframe of response counts, return a new one
-    with the response counts converted to percentages.
-    """
-    # Warn if the rows have different counts
-    # If they do, the percentages shouldn't be compared.
-    responses_per_question = counts.sum(axis="columns")
-    responses_to_first_question = responses_per_question.iloc[0]
-    responses_same = responses_per_question == responses_to_first_question
-    if not responses_same.all():
-        warn(
-            "In your data, not all questions have the same number of responses. i.e., different numbers of people answered each question. Therefore, the percentages aren't directly comparable: X% for one question represents a different number of responses than X% for another question, yet they will appear the same in the percentage graph. This may be misleading to your reader."
-        )
-    return counts.divide(counts.sum(axis="columns"), axis="rows") * 100
+    return normalize_counts(counts, dtype=dtype, round_integers=round_integers)
 
 
 def likert_response(df: pd.DataFrame, scale: Scale) -> pd.DataFrame:
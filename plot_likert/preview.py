@@ -0,0 +1,273 @@
+"""
+Progressively refined previews of Likert plots for very large datasets
+
+Instead of counting every response up front, these helpers estimate the counts
+from a growing random sample of the rows, along with confidence bounds for each segment,
+until either the estimates are precise enough or the whole dataset has been counted.
+"""
+
+import typing
+
+import numpy as np
+import pandas as pd
+
+import matplotlib.axes
+
+from plot_likert.scales import Scale
+import plot_likert.colors as builtin_colors
+from plot_likert.plot_likert import likert_counts, PlotLikertError, _plot_counts
+
+PreviewStage = typing.Tuple[pd.DataFrame, pd.DataFrame, int]
+
+
+def likert_counts_preview(
+    df: typing.Union[pd.DataFrame, pd.Series],
+    scale: Scale,
+    label_max_width=30,
+    drop_zeros=False,
+    tolerance: float = 0.01,
+    initial_sample_size: int = 1000,
+    growth_factor: float = 4,
+    z_score: float = 1.96,
+    compute_percentages: bool = False,
+    random_state=None,
+) -> typing.Generator[PreviewStage, None, None]:
+    """
+    Estimate the counts of Likert responses from increasingly large random samples of the rows.
+
+    Each stage yields a tuple of (estimated counts, bounds, sample size).
+    The bounds are the half-widths of the confidence interval around each estimate,
+    in the same units as the estimates. Counts are scaled up to the size of the full dataset,
+    or expressed as percentages if compute_percentages is set.
+
+    Rows are sampled without replacement, and each stage only counts the rows it adds,
+    so going through every stage costs about as much as a single call to likert_counts.
+    The bounds are the half-widths of Wilson score intervals, which (unlike the usual
+    normal approximation) aren't zero when a response was never or always chosen in the sample;
+    questions without any sampled responses get the widest possible bound of 50%.
+    Note that the bounds are applied around the sample estimate rather than the Wilson midpoint,
+    so near 0 or 100% they can reach past the possible range.
+    Iteration stops early once every bound is within the given tolerance;
+    otherwise, the last stage covers the whole dataset and yields the exact counts,
+    with bounds of zero.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or pandas.Series
+        A dataframe with questions in column names and answers recorded as cell values.
+    scale : list of str
+        The scale of possible responses.
+    label_max_width : int
+        The character wrap length of the question labels.
+    drop_zeros : bool
+        Indicates whether the data have NA values that should be dropped (True) or not (False).
+    tolerance : float, default = 0.01
+        Stop once every bound is at most this fraction of the rows in the dataset
+        (or, with compute_percentages, of the responses to each question).
+    initial_sample_size : int, default = 1000
+        The number of rows sampled for the first stage.
+    growth_factor : float, default = 4
+        How much bigger each stage's sample is than the previous one.
+    z_score : float, default = 1.96
+        The z-score of the confidence level for the bounds (1.96 is 95%).
+    compute_percentages : bool, default = False
+        Report the estimates and bounds as percentages of the responses to each question.
+    random_state : int or numpy.random.Generator, optional
+        Seed for the row sampling.
+    """
+    if initial_sample_size < 1:
+        raise PlotLikertError("initial_sample_size must be at least 1")
+    if growth_factor <= 1:
+        raise PlotLikertError("growth_factor must be greater than 1")
+
+    if type(df) == pd.core.series.Series:
+        df = df.to_frame()
+
+    total_rows = len(df)
+    order = np.random.default_rng(random_state).permutation(total_rows)
+
+    counts = None
+    sample_size = 0
+    next_size = min(initial_sample_size, total_rows)
+    while True:
+        new_rows = df.iloc[order[sample_size:next_size]]
+        stage_counts = likert_counts(new_rows, scale, label_max_width, drop_zeros)
+        counts = stage_counts if counts is None else counts + stage_counts
+        sample_size = next_size
+
+        estimates, bounds, max_error = _estimate_from_sample(
+            counts, sample_size, total_rows, z_score, compute_percentages
+        )
+        yield estimates, bounds, sample_size
+
+        if sample_size >= total_rows or max_error <= tolerance:
+            return
+        next_size = min(int(np.ceil(sample_size * growth_factor)), total_rows)
+
+
+def _estimate_from_sample(
+    counts: pd.DataFrame,
+    sample_size: int,
+    total_rows: int,
+    z_score: float,
+    compute_percentages: bool,
+) -> typing.Tuple[pd.DataFrame, pd.DataFrame, float]:
+    """
+    Given the counts of responses in a sample of rows, return the estimated counts
+    for the whole dataset, the half-widths of their confidence intervals,
+    and the largest half-width as a fraction of the denominator:
+    the number of rows, or with compute_percentages, the number of responses to each question.
+    """
+    # Finite population correction: the bounds shrink to zero as the sample covers every row
+    if total_rows > 1:
+        correction = (total_rows - sample_size) / (total_rows - 1)
+    else:
+        correction = 0.0
+
+    if compute_percentages:
+        denominators = counts.sum(axis="columns").replace(0, np.nan)
+        shares = counts.divide(denominators, axis="rows").fillna(0)
+        estimates = shares * 100
+        scale_factor = 100
+    else:
+        denominators = pd.Series(sample_size, index=counts.index)
+        shares = counts / sample_size
+        # Multiply before dividing, so that a full sample gives back the exact counts
+        estimates = counts * total_rows / sample_size
+        scale_factor = total_rows
+
+    # Half-width of the Wilson score interval, which stays positive when a share is 0 or 1
+    n = denominators.to_numpy()[:, np.newaxis]
+    z_squared = z_score**2
+    errors = (
+        z_score
+        / (1 + z_squared / n)
+        * np.sqrt((shares * (1 - shares) / n + z_squared / (4 * n**2)) * correction)
+    )
+    # A question without any sampled responses could still have any shares at all,
+    # so it gets the widest bound possible, unless every row has already been counted
+    unanswered = np.isnan(n[:, 0])
+    errors = errors.fillna(0)
+    errors.loc[unanswered] = 0.5 if correction > 0 else 0.0
+    max_error = float(errors.to_numpy().max()) if errors.size else 0.0
+
+    return estimates, errors * scale_factor, max_error
+
+
+def plot_likert_preview(
+    df: typing.Union[pd.DataFrame, pd.Series],
+    plot_scale: Scale,
+    plot_percentage: bool = False,
+    colors: builtin_colors.Colors = builtin_colors.default,
+    label_max_width: int = 30,
+    drop_zeros: bool = False,
+    figsize=None,
+    xtick_interval: typing.Optional[int] = None,
+    tolerance: float = 0.01,
+    initial_sample_size: int = 1000,
+    growth_factor: float = 4,
+    z_score: float = 1.96,
+    random_state=None,
+    error_color: str = "black",
+    **kwargs,
+) -> typing.Generator[matplotlib.axes.Axes, None, None]:
+    """
+    Plot progressively refined estimates of the given Likert-type dataset.
+
+    Each stage is plotted with plot_counts, with error bars at the end of every segment
+    showing its confidence bounds, and the axes are yielded as soon as they're ready.
+    See likert_counts_preview for how the stages are chosen and when they stop.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame or pandas.Series
+        A dataframe with questions in column names and answers recorded as cell values.
+    plot_scale : list
+        The scale used for the actual plot: a list of strings in order for answer options.
+    plot_percentage : bool
+        Normalize the answer counts.
+    colors : list of str
+        A list of colors in hex string or RGB tuples to use for plotting.
+    label_max_width : int
+        The character wrap length of the y-axis labels.
+    drop_zeros : bool
+        Indicates whether the data have NA values that should be dropped (True) or not (False).
+    figsize : tuple of (int, int)
+        A tuple (width, heigth) that controls size of the final figure - \
+        similarly to matplotlib
+    xtick_interval : int
+        Controls the interval between x-axis ticks.
+    tolerance : float, default = 0.01
+        Stop once every bound is at most this fraction of the rows in the dataset
+        (or, with plot_percentage, of the responses to each question).
+    initial_sample_size : int, default = 1000
+        The number of rows sampled for the first stage.
+    growth_factor : float, default = 4
+        How much bigger each stage's sample is than the previous one.
+    z_score : float, default = 1.96
+        The z-score of the confidence level for the bounds (1.96 is 95%).
+    random_state : int or numpy.random.Generator, optional
+        Seed for the row sampling.
+    error_color : str, default = "black"
+        The color of the error bars.
+    **kwargs
+        Options to pass to pandas plotting method.
+
+    Yields
+    ------
+    matplotlib.axes.Axes
+        The axes of the Likert plot for each stage
+    """
+    scale = plot_scale[1:] if drop_zeros else plot_scale
+
+    for estimates, bounds, sample_size in likert_counts_preview(
+        df,
+        plot_scale,
+        label_max_width=label_max_width,
+        drop_zeros=drop_zeros,
+        tolerance=tolerance,
+        initial_sample_size=initial_sample_size,
+        growth_factor=growth_factor,
+        z_score=z_score,
+        compute_percentages=plot_percentage,
+        random_state=random_state,
+    ):
+        # The estimates are already percentages if requested, so they're plotted as they are
+        # (normalizing them again would turn questions without responses into NaN)
+        axes = _plot_counts(
+            estimates,
+            scale,
+            plot_percentage,
+            colors=colors,
+            figsize=figsize,
+            xtick_interval=xtick_interval,
+            **kwargs,
+        )
+
+        # Keep each segment's interval within the possible range of values
+        maximum = 100 if plot_percentage else len(df)
+        reversed_estimates = estimates.iloc[::-1].to_numpy()
+        reversed_bounds = bounds.iloc[::-1].to_numpy()
+        lower_bounds = np.minimum(reversed_bounds, reversed_estimates)
+        upper_bounds = np.minimum(reversed_bounds, maximum - reversed_estimates)
+
+        # The bars are drawn with their rows reversed, and the first container is the padding
+        for i, segment in enumerate(axes.containers[1:]):
+            ends = [patch.get_x() + patch.get_width() for patch in segment]
+            middles = [patch.get_y() + patch.get_height() / 2 for patch in segment]
+            axes.errorbar(
+                ends,
+                middles,
+                xerr=[lower_bounds[:, i], upper_bounds[:, i]],
+                fmt="none",
+                ecolor=error_color,
+                capsize=2,
+                linewidth=1,
+            )
+
+        axes.set_title(
+            "Exact counts"
+            if sample_size >= len(df)
+            else "Estimate from %d of %d rows" % (sample_size, len(df))
+        )
+        yield axes
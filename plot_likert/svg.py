@@ -0,0 +1,317 @@
+"""
+Render Likert plots directly to SVG, without going through matplotlib
+
+This follows the same layout rules as plot_likert.plot_counts
+(centering on the neutral response, padding, tick intervals, and bar label cutoff),
+but builds the SVG markup by hand, which is much faster for small charts.
+"""
+
+import typing
+from xml.sax.saxutils import escape
+
+import numpy as np
+import pandas as pd
+
+from plot_likert.scales import Scale
+import plot_likert.colors as builtin_colors
+import plot_likert.interval as interval_helper
+from plot_likert.common import (
+    HIDE_EXCESSIVE_TICK_LABELS,
+    PADDING_LEFT,
+    PADDING_RIGHT,
+    BAR_LABEL_FORMAT,
+    BAR_LABEL_SIZE_CUTOFF,
+    PlotLikertError,
+    _compute_counts_percentage,
+)
+
+DEFAULT_FIGSIZE = (6.4, 4.8)  # same as matplotlib's default, in inches
+POINTS_PER_INCH = 72
+FONT_SIZE = 10  # in points
+LINE_HEIGHT = 1.2  # multiple of the font size
+BAR_HEIGHT = 0.8  # fraction of the space given to each question
+AXES_MARGIN = 0.05  # fraction of the data range added on each side, like matplotlib
+# Position of the axes within the figure, as fractions of its size: matplotlib's default subplot parameters
+AXES_LEFT, AXES_RIGHT, AXES_BOTTOM, AXES_TOP = 0.125, 0.9, 0.11, 0.88
+# Gap between the axes and the legend, as a fraction of the axes width
+LEGEND_OFFSET = 0.05
+LEGEND_SWATCH_SIZE = 10  # in points
+
+
+def _svg_color(color) -> str:
+    """
+    Convert a matplotlib-style color (name, hex string, or RGB(A) tuple of floats)
+    into a value that can be used in an SVG attribute.
+    """
+    if isinstance(color, str):
+        return color
+    channels = [int(round(255 * c)) for c in color[:3]]
+    if len(color) > 3:
+        return "rgba(%d,%d,%d,%g)" % (*channels, color[3])
+    return "rgb(%d,%d,%d)" % tuple(channels)
+
+
+def _text_width(text: str) -> float:
+    """
+    A rough estimate of the rendered width of the given text, in points
+    """
+    return len(text) * FONT_SIZE * 0.6
+
+
+def _text(x: float, y: float, text: str, anchor: str = "start", **attributes) -> str:
+    """
+    Return an SVG text element; multi-line text is split into tspans.
+    """
+    lines = str(text).split("\n")
+    extra = "".join(
+        ' %s="%s"' % (name.replace("_", "-"), escape(str(value)))
+        for name, value in attributes.items()
+    )
+    # Center the block of lines vertically on y
+    first_offset = -(len(lines) - 1) / 2 * LINE_HEIGHT
+    spans = "".join(
+        '<tspan x="%.2f" dy="%.2fem">%s</tspan>'
+        % (x, first_offset if i == 0 else LINE_HEIGHT, escape(line))
+        for i, line in enumerate(lines)
+    )
+    return (
+        '<text x="%.2f" y="%.2f" text-anchor="%s" dominant-baseline="central"%s>%s</text>'
+        % (x, y, anchor, extra, spans)
+    )
+
+
+def plot_counts_svg(
+    counts: pd.DataFrame,
+    scale: Scale,
+    colors: builtin_colors.Colors = builtin_colors.default,
+    figsize=None,
+    xtick_interval: typing.Optional[int] = None,
+    compute_percentages: bool = False,
+    bar_labels: bool = False,
+    bar_labels_color: typing.Union[str, typing.List[str]] = "white",
+) -> str:
+    """
+    Plot the given counts of Likert responses as an SVG document.
+
+    This produces the same kind of figure as plot_counts, but returns it as an SVG string
+    instead of drawing it with matplotlib.
+
+    Parameters
+    ----------
+    counts : pd.DataFrame
+        The pre-computed counts of responses to a set of Likert-style questions,
+        e.g., as returned by likert_counts.
+    scale : list of str
+        The scale used for the plot: an ordered list of strings for each of the answer options.
+    colors : list of str
+        A list of colors in hex string or RGB tuples to use for plotting.
+        The first color is used for the (invisible) padding.
+        If there are fewer colors than segments, they are cycled through, like in plot_counts.
+    figsize : tuple of (int, int)
+        A tuple (width, heigth) in inches that controls size of the final figure,
+        like the figsize of plot_counts: the image is widened to fit the legend outside of it
+    xtick_interval : int, optional
+        Controls the interval between x-axis ticks.
+    compute_percentages : bool, default = False,
+        Convert the given response counts to percentages and display the counts as percentages in the plot.
+    bar_labels : bool, default = False
+        Show a label with the value of each bar segment on top of it
+    bar_labels_color : str or list of str = "white",
+        If showing bar labels, use this color (or colors) for the text
+
+    Returns
+    -------
+    str
+        The SVG markup of the generated Likert plot
+
+    See Also
+    --------
+    plot_counts : the matplotlib-based equivalent of this function.
+    """
+    if compute_percentages:
+        counts = _compute_counts_percentage(counts)
+
+    if isinstance(bar_labels_color, list):
+        if len(bar_labels_color) != len(scale):
+            raise PlotLikertError(
+                "list of bar label colors must have as many values as the scale"
+            )
+        bar_label_colors = bar_labels_color
+    else:
+        bar_label_colors = [bar_labels_color] * len(scale)
+
+    values = counts.to_numpy(dtype=float)
+    num_questions, num_responses = values.shape
+
+    # Pad each row/question from the left, so that they're centered around the middle (Neutral) response
+    scale_middle = len(scale) // 2
+    middles = values[:, 0:scale_middle].sum(axis=1)
+    if scale_middle != len(scale) / 2:
+        middles = middles + values[:, scale_middle] / 2
+    center = middles.max()
+    padding_values = np.abs(middles - center)
+
+    # Left edge of each segment, in data coordinates
+    padded = np.column_stack([padding_values, values])
+    lefts = np.cumsum(padded, axis=1) - padded
+    data_max = padded.sum(axis=1).max()
+
+    # Figure geometry, in points. The axes get the same size as in plot_counts,
+    # and the canvas grows to fit the question labels and the legend around them,
+    # like matplotlib's savefig(bbox_inches="tight") would.
+    if figsize is None:
+        figsize = DEFAULT_FIGSIZE
+    axes_width = figsize[0] * POINTS_PER_INCH * (AXES_RIGHT - AXES_LEFT)
+    axes_height = figsize[1] * POINTS_PER_INCH * (AXES_TOP - AXES_BOTTOM)
+    question_labels = [str(label) for label in counts.index]
+    response_labels = [str(label) for label in counts.columns]
+    label_width = max(
+        [_text_width(line) for label in question_labels for line in label.split("\n")]
+        + [0]
+    )
+    legend_width = LEGEND_SWATCH_SIZE * 2 + max(
+        [_text_width(label) for label in response_labels] + [0]
+    )
+    legend_height = len(response_labels) * FONT_SIZE * LINE_HEIGHT * 1.5
+    plot_left = label_width + FONT_SIZE
+    plot_right = plot_left + axes_width
+    plot_top = FONT_SIZE
+    plot_bottom = plot_top + axes_height
+    legend_left = plot_right + axes_width * LEGEND_OFFSET
+    width = legend_left + legend_width + FONT_SIZE
+    height = max(plot_bottom + FONT_SIZE * LINE_HEIGHT * 3, plot_top + legend_height)
+
+    # Compute x labels
+    max_width = int(round(data_max))
+    if xtick_interval is None:
+        # Mirrors matplotlib's XAxis.get_tick_space
+        num_ticks = int(np.floor(axes_width / (FONT_SIZE * 3)))
+        interval = interval_helper.get_interval_for_scale(num_ticks, max_width)
+    else:
+        interval = xtick_interval
+
+    right_edge = max_width - center
+    right_labels = np.arange(interval, right_edge + interval, interval)
+    left_labels = np.arange(0, center + 1, interval)
+    xlabels = np.concatenate([left_labels, right_labels])
+    xvalues = np.concatenate([center - left_labels, center + right_labels])
+
+    # Adjust padding
+    counts_sum = values.sum(axis=1).max()
+    x_min = -AXES_MARGIN * data_max - counts_sum * PADDING_LEFT
+    x_max = (1 + AXES_MARGIN) * data_max - counts_sum * PADDING_RIGHT
+
+    def to_x(value):
+        return plot_left + (value - x_min) / (x_max - x_min) * (plot_right - plot_left)
+
+    row_height = (plot_bottom - plot_top) / max(num_questions, 1)
+    bar_height = row_height * BAR_HEIGHT
+
+    def to_y(row):
+        return plot_top + (row + 0.5) * row_height
+
+    elements = [
+        '<svg xmlns="http://www.w3.org/2000/svg" width="%gpt" height="%gpt" viewBox="0 0 %g %g" font-family="sans-serif" font-size="%g">'
+        % (width, height, width, height, FONT_SIZE),
+        '<rect width="100%" height="100%" fill="white"/>',
+    ]
+
+    # Draw the bars
+    bar_label_format = BAR_LABEL_FORMAT + ("%%" if compute_percentages else "")
+    bar_size_cutoff = counts_sum * BAR_LABEL_SIZE_CUTOFF
+    for row in range(num_questions):
+        y = to_y(row)
+        for column in range(num_responses):
+            segment_width = values[row, column]
+            if segment_width <= 0:
+                continue
+            x0 = to_x(lefts[row, column + 1])
+            x1 = to_x(lefts[row, column + 1] + segment_width)
+            elements.append(
+                '<rect x="%.2f" y="%.2f" width="%.2f" height="%.2f" fill="%s"/>'
+                % (
+                    x0,
+                    y - bar_height / 2,
+                    x1 - x0,
+                    bar_height,
+                    escape(_svg_color(colors[(column + 1) % len(colors)])),
+                )
+            )
+            if bar_labels and segment_width >= bar_size_cutoff:
+                elements.append(
+                    _text(
+                        (x0 + x1) / 2,
+                        y,
+                        bar_label_format % segment_width,
+                        anchor="middle",
+                        fill=_svg_color(bar_label_colors[column]),
+                        font_weight="bold",
+                    )
+                )
+
+    # Draw center line
+    elements.append(
+        '<line x1="%.2f" y1="%.2f" x2="%.2f" y2="%.2f" stroke="black" stroke-opacity="0.5" stroke-dasharray="4,2"/>'
+        % (to_x(center), plot_top, to_x(center), plot_bottom)
+    )
+
+    # Draw the axes frame
+    elements.append(
+        '<rect x="%.2f" y="%.2f" width="%.2f" height="%.2f" fill="none" stroke="black"/>'
+        % (plot_left, plot_top, plot_right - plot_left, plot_bottom - plot_top)
+    )
+
+    # Question labels
+    for row, label in enumerate(question_labels):
+        elements.append(
+            _text(plot_left - FONT_SIZE / 2, to_y(row), label, anchor="end")
+        )
+
+    # Ensure tick labels don't exceed number of participants
+    # (or, in the case of percentages, 100%) since that looks confusing
+    elements.append('<g class="xticks">')
+    for label, value in zip(xlabels, xvalues):
+        if not x_min <= value <= x_max:
+            continue  # matplotlib doesn't show ticks outside of the axes
+        x = to_x(value)
+        elements.append(
+            '<line x1="%.2f" y1="%.2f" x2="%.2f" y2="%.2f" stroke="black"/>'
+            % (x, plot_bottom, x, plot_bottom + FONT_SIZE / 3)
+        )
+        if round(label) != label:
+            continue
+        if HIDE_EXCESSIVE_TICK_LABELS and label > counts_sum:
+            continue
+        text = str(int(label)) + ("%" if compute_percentages else "")
+        elements.append(
+            _text(x, plot_bottom + FONT_SIZE * LINE_HEIGHT, text, anchor="middle")
+        )
+    elements.append("</g>")
+
+    xlabel = "Percentage of Responses" if compute_percentages else "Number of Responses"
+    elements.append(
+        _text(
+            (plot_left + plot_right) / 2,
+            plot_bottom + FONT_SIZE * LINE_HEIGHT * 2.3,
+            xlabel,
+            anchor="middle",
+        )
+    )
+
+    # Legend, outside of the axes like in plot_counts
+    for i, label in enumerate(response_labels):
+        y = plot_top + (i + 0.5) * FONT_SIZE * LINE_HEIGHT * 1.5
+        elements.append(
+            '<rect x="%.2f" y="%.2f" width="%g" height="%g" fill="%s"/>'
+            % (
+                legend_left,
+                y - LEGEND_SWATCH_SIZE / 2,
+                LEGEND_SWATCH_SIZE,
+                LEGEND_SWATCH_SIZE,
+                escape(_svg_color(colors[(i + 1) % len(colors)])),
+            )
+        )
+        elements.append(_text(legend_left + LEGEND_SWATCH_SIZE * 1.5, y, label))
+
+    elements.append("</svg>")
+    return "\n".join(elements)
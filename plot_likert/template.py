@@ -0,0 +1,273 @@
+"""
+Reusable plot templates, for rendering many plots of the same shape
+
+Building a figure is the most expensive part of plot_counts.
+When many plots share the same scale, number of questions, and figure size,
+a template builds the figure once and then only updates the bars, ticks, and labels for each plot.
+"""
+
+import collections
+import typing
+
+import numpy as np
+import pandas as pd
+
+import matplotlib.axes
+import matplotlib.pyplot as plt
+import matplotlib.text
+
+from plot_likert.scales import Scale
+import plot_likert.colors as builtin_colors
+import plot_likert.interval as interval_helper
+from plot_likert.plot_likert import (
+    PADDING_LEFT,
+    PADDING_RIGHT,
+    PlotLikertError,
+    _add_bar_labels,
+    _compute_counts_percentage,
+    _compute_xticks,
+    _wrap_label,
+)
+
+MAX_TEMPLATES = 32  # how many templates to keep before evicting the least recently used
+
+TemplateKey = typing.Tuple[typing.Any, ...]
+_templates: "collections.OrderedDict[TemplateKey, PlotTemplate]" = (
+    collections.OrderedDict()
+)
+
+
+class PlotTemplate:
+    """
+    A pre-built Likert plot whose bars can be updated with new counts.
+
+    The figure is built once, with the same styling as plot_counts, and each call to render
+    moves the bars, center line, and ticks to match the given counts.
+    Since the same figure is reused, the axes returned by an earlier render
+    will show the data of the latest one: save or copy them before rendering again.
+
+    The figure isn't managed by pyplot, so use `template.figure.savefig(...)` to save it
+    (or display `template.figure` in a notebook).
+
+    Parameters
+    ----------
+    scale : list of str
+        The scale used for the plot: an ordered list of strings for each of the answer options.
+    num_questions : int
+        The number of questions (rows) in each plot.
+    figsize : tuple of (int, int)
+        A tuple (width, heigth) that controls size of the final figure - similarly to matplotlib
+    colors : list of str
+        A list of colors in hex string or RGB tuples to use for plotting.
+    """
+
+    def __init__(
+        self,
+        scale: Scale,
+        num_questions: int,
+        figsize=None,
+        colors: builtin_colors.Colors = builtin_colors.default,
+    ):
+        self.scale = list(scale)
+        self.num_questions = num_questions
+
+        skeleton = pd.DataFrame(
+            np.zeros((num_questions, len(scale) + 1)), columns=[""] + self.scale
+        )
+        self.axes = skeleton.plot.barh(stacked=True, color=colors, figsize=figsize)
+        self.figure = self.axes.figure
+        # Keep pyplot from accumulating (and auto-displaying) every template's figure
+        plt.close(self.figure)
+
+        self._bars = self.axes.containers[: len(scale) + 1]
+        self._center_line = self.axes.axvline(
+            0, linestyle="--", color="black", alpha=0.5
+        )
+        self._center_line.set_zorder(-1)
+
+        # Reposition the legend if present
+        if self.axes.get_legend():
+            self.axes.legend(bbox_to_anchor=(1.05, 1))
+
+        self._tick_space = self.axes.xaxis.get_tick_space()
+        self._bar_labels: typing.List[matplotlib.text.Text] = []
+
+    def render(
+        self,
+        counts: pd.DataFrame,
+        xtick_interval: typing.Optional[int] = None,
+        compute_percentages: bool = False,
+        bar_labels: bool = False,
+        bar_labels_color: typing.Union[str, typing.List[str]] = "white",
+    ) -> matplotlib.axes.Axes:
+        """
+        Update the plot to show the given counts of Likert responses.
+        The parameters are the same as for plot_counts.
+        """
+        if counts.shape != (self.num_questions, len(self.scale)):
+            raise PlotLikertError(
+                f"this template is for {self.num_questions} questions and {len(self.scale)} responses, but the counts have shape {counts.shape}"
+            )
+
+        if compute_percentages:
+            counts = _compute_counts_percentage(counts)
+        values = counts.to_numpy(dtype=float)
+
+        # Pad each row/question from the left, so that they're centered around the middle (Neutral) response
+        scale_middle = len(self.scale) // 2
+        middles = values[:, 0:scale_middle].sum(axis=1)
+        if scale_middle != len(self.scale) / 2:
+            middles = middles + values[:, scale_middle] / 2
+        center = middles.max()
+        padded = np.column_stack([np.abs(middles - center), values])
+        lefts = np.cumsum(padded, axis=1) - padded
+
+        # The bars are drawn with the rows reversed, to keep the questions in order
+        for column, container in enumerate(self._bars):
+            widths = padded[::-1, column]
+            for patch, left, width in zip(container, lefts[::-1, column], widths):
+                patch.set_x(left)
+                patch.set_width(width)
+            container.datavalues = widths
+        self.axes.set_yticks(range(self.num_questions))
+        self.axes.set_yticklabels(counts.index[::-1])
+        self._center_line.set_xdata([center, center])
+
+        # Autoscale to the new bars (setting the ticks below may widen the limits further)
+        self.axes.relim()
+        self.axes.set_autoscalex_on(True)
+        self.axes.autoscale_view(scaley=False)
+
+        # Compute and show x labels
+        max_width = int(round(padded.sum(axis=1).max()))
+        if xtick_interval is None:
+            interval = interval_helper.get_interval_for_scale(
+                self._tick_space, max_width
+            )
+        else:
+            interval = xtick_interval
+
+        counts_sum = values.sum(axis=1).max()
+        xvalues, xlabels = _compute_xticks(
+            center, max_width, interval, counts_sum, compute_percentages
+        )
+        self.axes.set_xticks(xvalues)
+        self.axes.set_xticklabels(xlabels)
+        if compute_percentages:
+            self.axes.set_xlabel("Percentage of Responses")
+        else:
+            self.axes.set_xlabel("Number of Responses")
+
+        # Adjust padding the same way as plot_counts
+        x_min, x_max = self.axes.get_xlim()
+        self.axes.set_xlim(
+            x_min - counts_sum * PADDING_LEFT, x_max - counts_sum * PADDING_RIGHT
+        )
+
+        # Replace the labels from the previous render
+        for label in self._bar_labels:
+            label.remove()
+        self._bar_labels = []
+        if bar_labels:
+            self._bar_labels = _add_bar_labels(
+                self.axes, self.scale, counts_sum, compute_percentages, bar_labels_color
+            )
+
+        return self.axes
+
+    def close(self):
+        """
+        Release the template's figure.
+        """
+        plt.close(self.figure)
+
+
+def _template_key(
+    scale: Scale, num_questions: int, figsize, colors: builtin_colors.Colors
+) -> TemplateKey:
+    return (
+        tuple(scale),
+        num_questions,
+        tuple(figsize) if figsize is not None else None,
+        tuple(color if isinstance(color, str) else tuple(color) for color in colors),
+    )
+
+
+def get_template(
+    scale: Scale,
+    num_questions: int,
+    figsize=None,
+    colors: builtin_colors.Colors = builtin_colors.default,
+) -> PlotTemplate:
+    """
+    Return the pooled template for the given plot shape, building it if needed.
+    Once there are more than MAX_TEMPLATES, the least recently used ones are evicted.
+    """
+    key = _template_key(scale, num_questions, figsize, colors)
+    if key in _templates:
+        _templates.move_to_end(key)
+        return _templates[key]
+
+    template = PlotTemplate(scale, num_questions, figsize=figsize, colors=colors)
+    _templates[key] = template
+    while len(_templates) > MAX_TEMPLATES:
+        _, evicted = _templates.popitem(last=False)
+        evicted.close()
+    return template
+
+
+def evict_template(
+    scale: Scale,
+    num_questions: int,
+    figsize=None,
+    colors: builtin_colors.Colors = builtin_colors.default,
+) -> bool:
+    """
+    Remove the pooled template for the given plot shape, returning whether there was one.
+    """
+    template = _templates.pop(
+        _template_key(scale, num_questions, figsize, colors), None
+    )
+    if template is None:
+        return False
+    template.close()
+    return True
+
+
+def clear_templates():
+    """
+    Remove every pooled template, and reset the memoized layout computations
+    (tick intervals and wrapped question labels).
+    """
+    while _templates:
+        _, template = _templates.popitem()
+        template.close()
+    interval_helper.get_interval_for_scale.cache_clear()
+    _wrap_label.cache_clear()
+
+
+def plot_counts_with_template(
+    counts: pd.DataFrame,
+    scale: Scale,
+    colors: builtin_colors.Colors = builtin_colors.default,
+    figsize=None,
+    xtick_interval: typing.Optional[int] = None,
+    compute_percentages: bool = False,
+    bar_labels: bool = False,
+    bar_labels_color: typing.Union[str, typing.List[str]] = "white",
+) -> matplotlib.axes.Axes:
+    """
+    Plot the given counts of Likert responses, reusing a pooled template of the same shape.
+
+    This takes the same parameters as plot_counts (except for pandas plotting options),
+    but the returned axes belong to the shared template and will change on the next call
+    with the same shape. See PlotTemplate for details.
+    """
+    template = get_template(scale, len(counts), figsize=figsize, colors=colors)
+    return template.render(
+        counts,
+        xtick_interval=xtick_interval,
+        compute_percentages=compute_percentages,
+        bar_labels=bar_labels,
+        bar_labels_color=bar_labels_color,
+    )
@@ -0,0 +1,87 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import plot_likert
+from plot_likert import index
+from plot_likert.index import IndexedResponses
+
+
+class TestIndexedResponses(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.scale = plot_likert.scales.agree
+        size = 1000
+        q1 = rng.choice(self.scale, size).astype(object)
+        q1[:10] = np.nan
+        self.data = pd.DataFrame(
+            {
+                "Q1": q1,
+                "Q2": rng.choice(self.scale, size),
+                "age": rng.choice(["18-24", "25-29", "30-34", "35+"], size),
+                "region": rng.choice(["EU", "US"], size),
+                "completed": rng.choice([True, False], size),
+            }
+        )
+        self.responses = IndexedResponses(
+            self.data, self.scale, filter_columns=["age", "region", "completed"]
+        )
+
+    def assertCountsMatch(self, expected_rows, counts):
+        expected = plot_likert.likert_counts(
+            self.data.loc[expected_rows, ["Q1", "Q2"]], self.scale
+        )
+        pd.testing.assert_frame_equal(
+            expected, counts, check_dtype=False, check_names=False
+        )
+
+    def test_no_filters(self):
+        self.assertCountsMatch(slice(None), self.responses.counts())
+
+    def test_combined_filters(self):
+        counts = self.responses.counts(
+            {"age": ["25-29", "30-34"]}, region="EU", completed=True
+        )
+        rows = (
+            self.data["age"].isin(["25-29", "30-34"])
+            & (self.data["region"] == "EU")
+            & self.data["completed"]
+        )
+        self.assertCountsMatch(rows, counts)
+
+    def test_unknown_value_matches_nothing(self):
+        counts = self.responses.counts(region="Antarctica")
+        self.assertEqual(0, counts.to_numpy().sum())
+
+    def test_unknown_column(self):
+        with self.assertRaises(plot_likert.PlotLikertError):
+            self.responses.counts(country="EU")
+
+    def test_invalid_response(self):
+        data = self.data.copy()
+        data.loc[5, "Q2"] = "agree"
+        with self.assertRaises(plot_likert.PlotLikertError):
+            IndexedResponses(
+                data, self.scale, filter_columns=["age", "region", "completed"]
+            )
+
+    def test_unknown_values_are_not_cached(self):
+        for i in range(10):
+            self.responses.counts(region="unknown %d" % i)
+        self.assertEqual(0, len(self.responses._indexes))
+
+    def test_index_cache_is_bounded(self):
+        responses = IndexedResponses(
+            self.data.assign(respondent=range(len(self.data))),
+            self.scale,
+            filter_columns=["respondent"],
+            questions=["Q1", "Q2"],
+        )
+        for respondent in range(index.MAX_CACHED_INDEXES + 10):
+            responses.counts(respondent=respondent)
+        self.assertEqual(index.MAX_CACHED_INDEXES, len(responses._indexes))
+        self.assertEqual(2, responses.counts(respondent=20).to_numpy().sum())
+
+        responses.clear_index_cache()
+        self.assertEqual(0, len(responses._indexes))
@@ -0,0 +1,83 @@
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+
+import plot_likert
+from plot_likert import PlotLikertError, normalize_counts
+
+
+class TestNormalizeCounts(unittest.TestCase):
+    def setUp(self):
+        self.counts = pd.DataFrame(
+            [[1.0, 1.0, 1.0], [2.0, 0.0, 4.0]],
+            index=["Q1", "Q2"],
+            columns=["Disagree", "Neutral", "Agree"],
+        )
+
+    def test_row_percentages(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            percentages = normalize_counts(self.counts)
+        self.assertEqual(1, len(caught))
+        expected = (
+            self.counts.divide(self.counts.sum(axis="columns"), axis="rows") * 100
+        )
+        pd.testing.assert_frame_equal(expected, percentages)
+
+    def test_column_percentages(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            percentages = normalize_counts(self.counts, direction="column")
+        self.assertEqual(0, len(caught))
+        self.assertEqual([100 / 3, 200 / 3], list(percentages["Disagree"]))
+        self.assertEqual([100.0, 0.0], list(percentages["Neutral"]))
+
+    def test_float32(self):
+        percentages = normalize_counts(self.counts.iloc[:1], dtype=np.float32)
+        self.assertTrue((percentages.dtypes == np.float32).all())
+
+    def test_unsupported_dtype(self):
+        with self.assertRaises(PlotLikertError):
+            normalize_counts(self.counts, dtype=np.int64)
+
+    def test_round_integers_sums_to_100(self):
+        percentages = normalize_counts(self.counts.iloc[:1], round_integers=True)
+        self.assertEqual(100, percentages.sum(axis="columns").iloc[0])
+        self.assertEqual([34.0, 33.0, 33.0], list(percentages.iloc[0]))
+
+        rng = np.random.default_rng(0)
+        counts = pd.DataFrame(rng.integers(0, 50, size=(100, 7)))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            percentages = normalize_counts(counts, round_integers=True)
+        np.testing.assert_array_equal(100, percentages.sum(axis="columns"))
+        exact = normalize_counts(counts)
+        self.assertLess((percentages - exact).abs().to_numpy().max(), 1)
+
+    def test_empty_rows_are_nan(self):
+        counts = pd.DataFrame([[0.0, 0.0], [1.0, 3.0]])
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            percentages = normalize_counts(counts, round_integers=True)
+        self.assertTrue(percentages.iloc[0].isna().all())
+        self.assertEqual([25.0, 75.0], list(percentages.iloc[1]))
+
+    def test_likert_percentages(self):
+        data = pd.DataFrame({"Q1": ["Agree", "Agree", "Disagree"]})
+        percentages = plot_likert.likert_percentages(
+            data, plot_likert.scales.agree, round_integers=True
+        )
+        self.assertEqual([0.0, 33.0, 0.0, 67.0, 0.0], list(percentages.loc["Q1"]))
+
+    def test_missing_counts_are_skipped(self):
+        counts = self.counts.copy()
+        counts.iloc[1, 1] = np.nan
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            percentages = normalize_counts(counts)
+            rounded = normalize_counts(counts, round_integers=True)
+        self.assertTrue(pd.isna(percentages.iloc[1, 1]))
+        self.assertEqual([100 / 3, 200 / 3], list(percentages.iloc[1, [0, 2]]))
+        self.assertEqual([33.0, 67.0], list(rounded.iloc[1, [0, 2]]))
@@ -0,0 +1,135 @@
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+
+import plot_likert
+from plot_likert.preview import likert_counts_preview, plot_likert_preview
+
+
+class TestPreview(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.scale = plot_likert.scales.agree
+        self.data = pd.DataFrame(
+            {
+                "Q1": rng.choice(self.scale, 5000),
+                "Q2": rng.choice(self.scale, 5000),
+            }
+        )
+
+    def test_last_stage_is_exact(self):
+        stages = list(
+            likert_counts_preview(
+                self.data, self.scale, tolerance=0, initial_sample_size=100
+            )
+        )
+        self.assertEqual([100, 400, 1600, 5000], [size for _, _, size in stages])
+        estimates, bounds, _ = stages[-1]
+        exact = plot_likert.likert_counts(self.data, self.scale)
+        pd.testing.assert_frame_equal(exact, estimates, check_dtype=False)
+        self.assertEqual(0, bounds.to_numpy().max())
+
+    def test_bounds_shrink(self):
+        stages = list(
+            likert_counts_preview(
+                self.data, self.scale, tolerance=0, initial_sample_size=100
+            )
+        )
+        max_bounds = [bounds.to_numpy().max() for _, bounds, _ in stages]
+        self.assertEqual(sorted(max_bounds, reverse=True), max_bounds)
+
+    def test_stops_at_tolerance(self):
+        stages = list(
+            likert_counts_preview(
+                self.data,
+                self.scale,
+                tolerance=0.05,
+                initial_sample_size=100,
+                compute_percentages=True,
+            )
+        )
+        estimates, bounds, size = stages[-1]
+        self.assertLess(size, len(self.data))
+        self.assertLessEqual(bounds.to_numpy().max(), 5)
+        np.testing.assert_allclose(100, estimates.sum(axis="columns"))
+
+    def test_plot_preview(self):
+        stages = list(
+            plot_likert_preview(
+                self.data, self.scale, initial_sample_size=1000, tolerance=0
+            )
+        )
+        self.assertEqual(3, len(stages))
+        self.assertEqual("Exact counts", stages[-1].get_title())
+
+    def test_unanimous_sample_does_not_stop_early(self):
+        data = pd.DataFrame({"Q1": ["Agree", "Disagree"] * 1000})
+        stages = list(
+            likert_counts_preview(
+                data, self.scale, initial_sample_size=1, random_state=0
+            )
+        )
+        self.assertGreater(stages[0][1].to_numpy().max(), 0)
+        self.assertGreater(stages[-1][2], 1)
+
+    def test_near_unanimous_bounds_are_never_zero(self):
+        data = pd.DataFrame({"Q1": ["Agree"] * 970 + ["Disagree"] * 30})
+        for seed in range(40):
+            for _, bounds, size in likert_counts_preview(
+                data, self.scale, initial_sample_size=50, random_state=seed
+            ):
+                if size < len(data):
+                    self.assertGreater(bounds.to_numpy().max(), 0)
+            self.assertGreater(size, 50)
+
+    def test_plot_percentages_with_unanswered_question(self):
+        data = self.data.assign(Q3=np.nan)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", UserWarning)
+            stages = list(
+                plot_likert_preview(
+                    data,
+                    self.scale,
+                    plot_percentage=True,
+                    initial_sample_size=1000,
+                    tolerance=0,
+                )
+            )
+        self.assertEqual("Percentage of Responses", stages[-1].get_xlabel())
+
+    def test_sparse_question_is_not_reported_as_exact(self):
+        data = pd.DataFrame(
+            {"Q1": np.resize(self.scale, 200_000), "Q2": np.nan}, dtype=object
+        )
+        data.loc[:4, "Q2"] = "Strongly agree"
+        stages = list(
+            likert_counts_preview(
+                data,
+                self.scale,
+                tolerance=0.05,
+                compute_percentages=True,
+                random_state=0,
+            )
+        )
+        for estimates, bounds, size in stages[:-1]:
+            if estimates.loc["Q2"].sum() == 0:
+                self.assertEqual(50, bounds.loc["Q2"].max())
+        estimates, _, _ = stages[-1]
+        self.assertEqual(100, estimates.loc["Q2", "Strongly agree"])
+
+    def test_error_bars_stay_within_range(self):
+        data = pd.DataFrame({"Q1": ["Agree"] * 990 + ["Disagree"] * 10})
+        axes = next(
+            plot_likert_preview(
+                data,
+                self.scale,
+                plot_percentage=True,
+                initial_sample_size=50,
+                random_state=0,
+            )
+        )
+        for collection in axes.collections:
+            for segment in collection.get_segments():
+                self.assertGreaterEqual(segment[:, 0].min(), -1e-9)
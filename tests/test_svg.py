@@ -0,0 +1,97 @@
+import subprocess
+import sys
+import textwrap
+import unittest
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pandas as pd
+
+import plot_likert
+from plot_likert.svg import plot_counts_svg
+
+
+class TestSvgRendering(unittest.TestCase):
+    def setUp(self):
+        data = pd.DataFrame(
+            {
+                "Q1": [
+                    "Strongly disagree",
+                    "Agree",
+                    "Agree",
+                    "Neither agree nor disagree",
+                ],
+                "Q2": ["Disagree", "Strongly agree", "Agree", "Agree"],
+            }
+        )
+        self.counts = plot_likert.likert_counts(data, plot_likert.scales.agree)
+
+    def test_output_is_valid_svg(self):
+        svg = plot_counts_svg(self.counts, plot_likert.scales.agree)
+        root = ET.fromstring(svg)
+        self.assertEqual("{http://www.w3.org/2000/svg}svg", root.tag)
+        self.assertIn("Number of Responses", svg)
+        self.assertIn("Q1", svg)
+
+    def test_percentages(self):
+        svg = plot_counts_svg(
+            self.counts,
+            plot_likert.scales.agree,
+            compute_percentages=True,
+            bar_labels=True,
+        )
+        ET.fromstring(svg)
+        self.assertIn("Percentage of Responses", svg)
+        self.assertIn("50%", svg)
+
+    def test_bar_label_colors_must_match_scale(self):
+        with self.assertRaises(plot_likert.PlotLikertError):
+            plot_counts_svg(
+                self.counts,
+                plot_likert.scales.agree,
+                bar_labels=True,
+                bar_labels_color=["white"],
+            )
+
+    def test_short_color_list_is_cycled(self):
+        svg = plot_counts_svg(
+            self.counts,
+            plot_likert.scales.agree,
+            colors=plot_likert.colors.likert5[:4],
+        )
+        ET.fromstring(svg)
+
+    def test_tick_labels_match_plot_counts(self):
+        scale = plot_likert.scales.agree
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame({f"Q{i}": rng.choice(scale, 125) for i in range(1, 6)})
+        counts = plot_likert.likert_counts(data, scale)
+
+        axes = plot_likert.plot_counts(counts, scale)
+        x_min, x_max = axes.get_xlim()
+        expected = [
+            label.get_text()
+            for label, value in zip(axes.get_xticklabels(), axes.get_xticks())
+            if label.get_text() and x_min <= value <= x_max
+        ]
+
+        root = ET.fromstring(plot_counts_svg(counts, scale))
+        xticks = root.find("{http://www.w3.org/2000/svg}g[@class='xticks']")
+        actual = [
+            "".join(text.itertext())
+            for text in xticks.iter("{http://www.w3.org/2000/svg}text")
+        ]
+        self.assertEqual(sorted(expected, key=int), sorted(actual, key=int))
+
+    def test_importable_without_matplotlib(self):
+        code = textwrap.dedent("""
+            import sys
+            sys.modules["matplotlib"] = None  # makes any import of matplotlib fail
+            import pandas as pd
+            import plot_likert
+            from plot_likert.svg import plot_counts_svg
+            assert not hasattr(plot_likert, "plot_counts")
+            counts = pd.DataFrame([[1, 2, 3, 4, 5]], columns=plot_likert.scales.agree)
+            plot_counts_svg(counts, plot_likert.scales.agree)
+            """)
+        subprocess.run([sys.executable, "-c", code], check=True)
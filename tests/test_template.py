@@ -0,0 +1,77 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import plot_likert
+from plot_likert import template
+
+
+class TestPlotTemplate(unittest.TestCase):
+    def setUp(self):
+        template.clear_templates()
+        rng = np.random.default_rng(0)
+        self.scale = plot_likert.scales.agree
+        data = pd.DataFrame(
+            {
+                "Q1": rng.choice(self.scale, 50),
+                "Q2": rng.choice(self.scale, 50, p=[0.1, 0.1, 0.2, 0.3, 0.3]),
+            }
+        )
+        self.counts = plot_likert.likert_counts(data, self.scale)
+
+    def tearDown(self):
+        template.clear_templates()
+
+    def test_matches_plot_counts(self):
+        for compute_percentages in [False, True]:
+            expected = plot_likert.plot_counts(
+                self.counts, self.scale, compute_percentages=compute_percentages
+            )
+            # Render something else first, to check that nothing is left over from it
+            plot_likert.plot_counts_with_template(self.counts * 3, self.scale)
+            axes = plot_likert.plot_counts_with_template(
+                self.counts, self.scale, compute_percentages=compute_percentages
+            )
+
+            self.assertEqual(expected.get_xlim(), axes.get_xlim())
+            np.testing.assert_array_equal(expected.get_xticks(), axes.get_xticks())
+            self.assertEqual(
+                [label.get_text() for label in expected.get_xticklabels()],
+                [label.get_text() for label in axes.get_xticklabels()],
+            )
+            for expected_bars, bars in zip(expected.containers, axes.containers):
+                for expected_patch, patch in zip(expected_bars, bars):
+                    self.assertAlmostEqual(expected_patch.get_x(), patch.get_x())
+                    self.assertAlmostEqual(
+                        expected_patch.get_width(), patch.get_width()
+                    )
+
+    def test_bar_labels_are_replaced(self):
+        axes = plot_likert.plot_counts_with_template(
+            self.counts, self.scale, bar_labels=True
+        )
+        num_texts = len(axes.texts)
+        plot_likert.plot_counts_with_template(self.counts, self.scale, bar_labels=True)
+        self.assertEqual(num_texts, len(axes.texts))
+        plot_likert.plot_counts_with_template(self.counts, self.scale)
+        self.assertEqual(0, len(axes.texts))
+
+    def test_pool(self):
+        first = template.get_template(self.scale, 2)
+        self.assertIs(first, template.get_template(self.scale, 2))
+        self.assertIsNot(first, template.get_template(self.scale, 3))
+        self.assertIsNot(first, template.get_template(self.scale, 2, figsize=(8, 4)))
+
+        self.assertTrue(template.evict_template(self.scale, 2))
+        self.assertFalse(template.evict_template(self.scale, 2))
+        self.assertIsNot(first, template.get_template(self.scale, 2))
+
+    def test_pool_size_is_bounded(self):
+        for num_questions in range(1, template.MAX_TEMPLATES + 5):
+            template.get_template(self.scale, num_questions)
+        self.assertEqual(template.MAX_TEMPLATES, len(template._templates))
+
+    def test_wrong_shape(self):
+        with self.assertRaises(plot_likert.PlotLikertError):
+            template.get_template(self.scale, 3).render(self.counts)
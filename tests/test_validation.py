@@ -0,0 +1,88 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import plot_likert
+from plot_likert import PlotLikertError, validate_responses
+
+
+class TestValidateResponses(unittest.TestCase):
+    def setUp(self):
+        self.scale = plot_likert.scales.agree
+        self.data = pd.DataFrame(
+            {
+                "Q1": ["Agree", " agree ", "Disagree", " agree ", np.nan],
+                "Q2": ["Strongly agree", "Agree", "Maybe", "Agree", "Disagree"],
+            }
+        )
+
+    def test_valid_data(self):
+        valid = self.data.iloc[[0, 2, 4], [0]]
+        cleaned, report = validate_responses(valid, self.scale)
+        pd.testing.assert_frame_equal(valid, cleaned)
+        self.assertEqual(0, len(report))
+
+    def test_strict_reports_every_invalid_value(self):
+        with self.assertRaises(PlotLikertError) as context:
+            validate_responses(self.data, self.scale)
+        message = str(context.exception)
+        self.assertIn("` agree ` (2x in `Q1`)", message)
+        self.assertIn("`Maybe` (1x in `Q2`)", message)
+
+    def test_likert_counts_uses_strict_validation(self):
+        with self.assertRaises(PlotLikertError):
+            plot_likert.likert_counts(self.data, self.scale)
+
+    def test_coerce(self):
+        cleaned, report = validate_responses(self.data, self.scale, mode="coerce")
+        self.assertEqual(2, cleaned["Q1"].isna().sum() - 1)
+        self.assertTrue(pd.isna(cleaned.loc[2, "Q2"]))
+        self.assertEqual(
+            [("Q1", " agree ", 2), ("Q2", "Maybe", 1)],
+            list(
+                report[["column", "value", "count"]].itertuples(index=False, name=None)
+            ),
+        )
+
+    def test_normalize(self):
+        cleaned, report = validate_responses(self.data, self.scale, mode="normalize")
+        self.assertEqual(
+            ["Agree", "Agree", "Disagree", "Agree"], list(cleaned["Q1"][:4])
+        )
+        self.assertTrue(pd.isna(cleaned.loc[2, "Q2"]))
+        self.assertEqual("Agree", report["replacement"].iloc[0])
+        self.assertTrue(pd.isna(report["replacement"].iloc[1]))
+
+    def test_normalize_numbers(self):
+        data = pd.Series([1, 2.0, "3", 5])
+        cleaned, report = validate_responses(
+            data, plot_likert.scales.raw5, mode="normalize"
+        )
+        self.assertEqual(["1", "2", "3", "5"], list(cleaned.iloc[:, 0]))
+        self.assertEqual(3, len(report))
+
+    def test_unknown_mode(self):
+        with self.assertRaises(PlotLikertError):
+            validate_responses(self.data, self.scale, mode="lenient")
+
+    def test_categorical_columns(self):
+        data = pd.Series(pd.Categorical(["Agree", " agree", "Disagree", "Maybe"]))
+        with self.assertRaises(PlotLikertError) as context:
+            validate_responses(data, self.scale)
+        self.assertIn("value ` agree`", str(context.exception))
+
+        cleaned, report = validate_responses(data, self.scale, mode="normalize")
+        self.assertEqual([" agree", "Maybe"], list(report["value"]))
+        self.assertEqual([1, 1], list(report["count"]))
+        self.assertEqual(["Agree", "Agree", "Disagree"], list(cleaned.iloc[:3, 0]))
+        self.assertTrue(pd.isna(cleaned.iloc[3, 0]))
+
+    def test_values_equal_across_types_are_kept_apart(self):
+        data = pd.Series([True, 1, 1.0, True], dtype=object)
+        cleaned, report = validate_responses(
+            data, plot_likert.scales.raw5, mode="normalize"
+        )
+        self.assertEqual([2, 1, 1], list(report["count"]))
+        self.assertTrue(pd.isna(cleaned.iloc[0, 0]))
+        self.assertEqual(["1", "1"], list(cleaned.iloc[1:3, 0]))